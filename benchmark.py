@@ -5,24 +5,22 @@ SpaceWorld CLI Framework Benchmark Tool
 
 import argparse
 import cProfile
+import heapq
 import json
-import os
 import platform
 import pstats
-import statistics
+import resource
 import sys
 import timeit
 import traceback
 import tracemalloc
-from contextlib import contextmanager
+from concurrent.futures import ProcessPoolExecutor, as_completed
 from datetime import datetime
+from functools import lru_cache
 from importlib.metadata import version
-from typing import Dict, List, Callable, Any, Optional, Set
+from typing import Dict, List, Callable, Any, Optional, Set, Tuple
 
-import click
-import cloup
-import fire
-import typer
+import numpy as np
 from rich.box import ROUNDED
 from rich.columns import Columns
 from rich.console import Console
@@ -32,7 +30,11 @@ from rich.rule import Rule
 from rich.table import Table
 from rich.text import Text
 
-import spaceworld
+try:
+    # Rust-сериализатор: в разы быстрее json и умеет numpy-массивы напрямую
+    import orjson
+except ImportError:
+    orjson = None
 
 DEFAULT_RUNS = 30
 DEFAULT_WARMUP = 5
@@ -63,6 +65,10 @@ class TestScenario:
         self.command = command
         self.description = description
         self.complexity = complexity
+        # Заранее разобранный argv, чтобы не вызывать split() в измеряемом участке
+        self.argv: List[str] = ["cli", *command.split()]
+        # Аргументы без имени программы — для parse_args/main(args=...)
+        self.args: List[str] = self.argv[1:]
 
 
 DEFAULT_SCENARIOS = [
@@ -85,18 +91,23 @@ class BenchmarkResult:
         self.times: List[float] = []
         self.memory_usage: List[int] = []
         self.profile_data: Optional[Dict] = None
+        # Статистики, посчитанные один раз в run_test, чтобы таблицы
+        # не сканировали массив времён заново на каждую строку
+        self.min_time: float = 0.0
+        self.max_time: float = 0.0
+        self.std_time: float = 0.0
 
     @property
     def avg_time(self) -> float:
-        return statistics.mean(self.times) if self.times else 0
+        return float(np.mean(self.times)) if len(self.times) else 0
 
     @property
     def avg_memory(self) -> float:
-        return statistics.mean(self.memory_usage) if self.memory_usage else 0
+        return float(np.mean(self.memory_usage)) if len(self.memory_usage) else 0
 
     @property
     def peak_memory(self) -> float:
-        return max(self.memory_usage) if self.memory_usage else 0
+        return float(np.max(self.memory_usage)) if len(self.memory_usage) else 0
 
 
 class BenchmarkLibrary:
@@ -112,15 +123,19 @@ class BenchmarkLibrary:
         self.execute_func = execute_func
         self.enabled = enabled
         self.color = LIBRARY_COLORS.get(name, 'white')
+        # Готовая Rich-разметка имени: не пересобирать f-строку на каждую строку таблиц
+        self.name_markup = f"[{self.color}]{name}[/]"
+        self.name_bold_markup = f"[bold {self.color}]{name}[/]"
         self.version = self._get_version()
         self.results: Dict[str, BenchmarkResult] = {}
+        self._env_cache: Dict[str, Any] = {}
+        self._profiler: Optional[cProfile.Profile] = None
 
     def _get_version(self) -> str:
         if self.name == 'testfunc':
             return '1.0'
-        elif self.name == 'spaceworld':
-            return spaceworld.__version__
         try:
+            # Версия берётся по имени дистрибутива — сам модуль не нужен
             return version(self.name)
         except:
             return 'unknown'
@@ -130,61 +145,110 @@ class BenchmarkLibrary:
             scenario: TestScenario,
             runs: int,
             warmup: int,
-            measure_memory: bool
+            measure_memory: bool,
+            memory_mode: str = "tracemalloc"
     ) -> BenchmarkResult:
         result = BenchmarkResult()
-        env = self.setup_func()
+        env = self._get_env(scenario)
+        # Прогрев ленивых инициализаций до измеряемого участка
+        for _ in range(warmup):
+            self.execute_func(env, scenario)
+        # stmt-строка вместо lambda: timeit впечатывает вызов в свой шаблон
+        # без лишнего Python-фрейма на каждую итерацию
         timer = timeit.Timer(
-            lambda: self.execute_func(env, scenario.command))
-        result.times = timer.repeat(repeat=runs, number=1)
+            stmt="fn(env, cmd)",
+            globals={"fn": self.execute_func, "env": env, "cmd": scenario},
+        )
+        # Авто-подбор числа внутренних итераций (>=0.2s на замер),
+        # чтобы цена запуска цикла не доминировала в результате
+        inner, _ = timer.autorange()
+        result.times = np.asarray(
+            timer.repeat(repeat=runs, number=inner), dtype=np.float64
+        ) / inner
+        result.min_time = float(result.times.min())
+        result.max_time = float(result.times.max())
+        if result.times.size > 1:
+            result.std_time = float(np.std(result.times, ddof=1))
 
         if measure_memory:
-            for _ in range(runs):
+            if memory_mode == "rusage":
+                # Грубый, но почти бесплатный замер: дельта пикового RSS
+                # вокруг всей серии вместо трассировки каждой аллокации
+                before = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+                for _ in range(runs):
+                    self.execute_func(env, scenario)
+                after = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+                # ru_maxrss на Linux — килобайты; нормируем на один вызов
+                delta = max(after - before, 0) * 1024 // max(runs, 1)
+                result.memory_usage = np.asarray([delta], dtype=np.int64)
+            else:
+                # Один start/stop на всю серию, между итерациями только reset_peak
                 tracemalloc.start()
-                self.execute_func(env, scenario.command)
-                _, peak = tracemalloc.get_traced_memory()
+                for _ in range(runs):
+                    tracemalloc.reset_peak()
+                    self.execute_func(env, scenario)
+                    _, peak = tracemalloc.get_traced_memory()
+                    result.memory_usage.append(peak)
                 tracemalloc.stop()
-                result.memory_usage.append(peak)
+                result.memory_usage = np.asarray(result.memory_usage, dtype=np.int64)
 
         self.results[scenario.name] = result
         return result
 
+    def _get_env(self, scenario: TestScenario) -> Any:
+        """Возвращает закэшированное окружение библиотеки для сценария"""
+        env = self._env_cache.get(scenario.name)
+        if env is None:
+            env = self._env_cache[scenario.name] = self.setup_func()
+        return env
+
     def run_profiling(
             self,
             scenario: TestScenario,
-            runs: int = 1
+            runs: int = 100
     ) -> Dict[str, Any]:
-        env = self.setup_func()
-        profiler = cProfile.Profile(timeunit=False, subcalls=False)
+        env = self._get_env(scenario)
+        # Один ленивый Profile на библиотеку; builtins=False снимает
+        # трассировку C-функций и уменьшает оверхед профилировщика
+        profiler = self._profiler
+        if profiler is None:
+            profiler = self._profiler = cProfile.Profile(
+                subcalls=False, builtins=False
+            )
+        else:
+            profiler.clear()
 
+        # Копим статистику за серию вызовов: на одном μs-вызове
+        # оверхед трассировщика cProfile доминирует над полезным временем
         profiler.enable()
-        self.execute_func(env, scenario.command)
+        for _ in range(runs):
+            self.execute_func(env, scenario)
         profiler.disable()
 
         stats = pstats.Stats(profiler)
-        stats.sort_stats(pstats.SortKey.TIME)
-        top_functions = []
+        stats.strip_dirs()
 
-        # Собираем и фильтруем результаты
-        for func, (cc, nc, tt, ct, callers) in stats.stats.items():
+        # Итоги одним проходом, без промежуточных словарей
+        total_time = sum(ct for _, _, _, ct, _ in stats.stats.values()) / runs
+        total_calls = sum(nc for _, nc, _, _, _ in stats.stats.values())
+
+        # Форматируем только top-K записей: O(N log K) вместо полного sort
+        top = heapq.nlargest(20, stats.stats.items(), key=lambda kv: kv[1][3])
+        top_functions = []
+        for func, (cc, nc, tt, ct, callers) in top:
             file, line, func_name = func
             normalized_time = ct / runs
 
             top_functions.append({
                 'function': func_name,
-                'location': f"{os.path.basename(file)}:{line}",
+                'location': f"{file}:{line}",
                 'time': normalized_time,
                 'time_str': format_time(normalized_time),
                 'calls': nc  # Добавляем количество вызовов
             })
 
-        sorted_functions = sorted(top_functions, key=lambda x: -x['time'])
-
-        total_time = sum(f['time'] for f in sorted_functions)
-        total_calls = sum(f['calls'] for f in sorted_functions)
-
         return {
-            'top_functions': sorted_functions,
+            'top_functions': top_functions,
             'total_time': total_time,
             'total_time_str': format_time(total_time),
             'total_calls': total_calls
@@ -202,7 +266,10 @@ class BenchmarkRunner:
             'warmup': DEFAULT_WARMUP,
             'output': DEFAULT_OUTPUT,
             'memory': True,
-            'profile': False
+            'memory_mode': 'tracemalloc',
+            'profile': False,
+            'parallel': True,
+            'verbose': False
         }
 
     def add_library(self, library: BenchmarkLibrary) -> None:
@@ -216,40 +283,93 @@ class BenchmarkRunner:
                 TextColumn("[bold blue]{task.description}"),
                 BarColumn(bar_width=50),
                 TextColumn("[progress.percentage]{task.percentage:>3.0f}%"),
-                console=console
+                console=console,
+                # Перерисовка по таймеру, а не на каждый update
+                refresh_per_second=4,
+                transient=True
         ) as progress:
             total = len(self.libraries) * len(self.scenarios)
             task = progress.add_task("Running benchmarks", total=total)
 
-            for scenario in self.scenarios:
-                for lib_name, library in self.libraries.items():
-                    if not library.enabled:
-                        continue
+            if self.config.get('parallel', True):
+                self._run_parallel(progress, task)
+            else:
+                self._run_serial(progress, task)
+
+    def _run_serial(self, progress: Progress, task: Any) -> None:
+        for scenario in self.scenarios:
+            for lib_name, library in self.libraries.items():
+                if not library.enabled:
+                    continue
+
+                progress.update(
+                    task,
+                    description=f"[{library.color}]Testing {lib_name} - {scenario.name}",
+                    refresh=False
+                )
 
-                    progress.update(
-                        task,
-                        description=f"[{library.color}]Testing {lib_name} - {scenario.name}"
+                try:
+                    result = library.run_test(
+                        scenario,
+                        self.config['runs'],
+                        self.config['warmup'],
+                        self.config['memory'],
+                        self.config.get('memory_mode', 'tracemalloc')
                     )
 
-                    try:
-                        result = library.run_test(
-                            scenario,
-                            self.config['runs'],
-                            self.config['warmup'],
-                            self.config['memory']
-                        )
+                    if self.config['profile']:
+                        profile_data = library.run_profiling(scenario)
+                        result.profile_data = profile_data
 
-                        if self.config['profile']:
-                            profile_data = library.run_profiling(scenario)
-                            result.profile_data = profile_data
+                    self.results.setdefault(scenario.name, {})[lib_name] = result
 
-                        self.results.setdefault(scenario.name, {})[lib_name] = result
+                except Exception as e:
+                    console.print(f"[red]Error testing {lib_name}: {e}")
+                    if self.config.get('verbose'):
+                        traceback.print_exc()
 
-                    except Exception as e:
-                        console.print(f"[red]Error testing {lib_name}: {e}")
+                progress.update(task, advance=1)
+
+    def _run_parallel(self, progress: Progress, task: Any) -> None:
+        """Гоняет независимые пары библиотека×сценарий по одному подпроцессу на ядро"""
+        jobs = [
+            (scenario, lib_name)
+            for scenario in self.scenarios
+            for lib_name, library in self.libraries.items()
+            if library.enabled
+        ]
+        with ProcessPoolExecutor() as executor:
+            futures = {
+                executor.submit(
+                    _run_one,
+                    lib_name,
+                    scenario,
+                    self.config['runs'],
+                    self.config['warmup'],
+                    self.config['memory'],
+                    self.config.get('memory_mode', 'tracemalloc')
+                ): (scenario, lib_name)
+                for scenario, lib_name in jobs
+            }
+            for future in as_completed(futures):
+                scenario, lib_name = futures[future]
+                try:
+                    result = future.result()
+
+                    # Профилирование остаётся в родительском процессе:
+                    # pstats-статистика не переносится через pickle
+                    if self.config['profile']:
+                        library = self.libraries[lib_name]
+                        result.profile_data = library.run_profiling(scenario)
+
+                    self.results.setdefault(scenario.name, {})[lib_name] = result
+
+                except Exception as e:
+                    console.print(f"[red]Error testing {lib_name}: {e}")
+                    if self.config.get('verbose'):
                         traceback.print_exc()
 
-                    progress.update(task, advance=1)
+                progress.update(task, advance=1)
 
     def print_results(self) -> None:
         console.print()
@@ -309,7 +429,7 @@ class BenchmarkRunner:
         for lib in self.libraries.values():
             status = "[green]✓" if lib.enabled else "[red]✗"
             libs_table.add_row(
-                f"[{lib.color}]{lib.name}[/]",
+                lib.name_markup,
                 lib.version,
                 status
             )
@@ -332,30 +452,35 @@ class BenchmarkRunner:
         summary_table.add_column("Efficiency", justify="right", width=12)
         summary_table.add_column("Performance", justify="left")
 
-        lib_results = {}
-        for lib_name in self.libraries:
-            if not self.libraries[lib_name].enabled:
-                continue
-
-            total_time = 0
-            total_memory = 0
-            count = 0
-
-            for scenario in self.scenarios:
-                if scenario.name in self.results and lib_name in self.results[scenario.name]:
-                    result = self.results[scenario.name][lib_name]
-                    total_time += result.avg_time
-                    total_memory += result.avg_memory
-                    count += 1
-
-            if count > 0:
-                lib_results[lib_name] = {
-                    "avg_time": total_time / count,
-                    "avg_memory": total_memory / count
-                }
+        # Один проход по результатам: суммы копим по ходу обхода,
+        # вместо трёх проверок принадлежности на каждую пару (lib, scenario)
+        totals: Dict[str, List] = {}
+        for per_lib in self.results.values():
+            for lib_name, result in per_lib.items():
+                acc = totals.get(lib_name)
+                if acc is None:
+                    acc = totals[lib_name] = [0.0, 0.0, 0]
+                acc[0] += result.avg_time
+                acc[1] += result.avg_memory
+                acc[2] += 1
+
+        if not totals:
+            return
 
-        best_time = min(result["avg_time"] for result in lib_results.values())
-        best_memory = min(result["avg_memory"] for result in lib_results.values())
+        # Средние и минимумы — в том же проходе, что и деление
+        lib_results = {}
+        best_time = best_memory = float("inf")
+        for lib_name, (total_time, total_memory, count) in totals.items():
+            avg_time = total_time / count
+            avg_memory = total_memory / count
+            lib_results[lib_name] = {
+                "avg_time": avg_time,
+                "avg_memory": avg_memory
+            }
+            if avg_time < best_time:
+                best_time = avg_time
+            if avg_memory < best_memory:
+                best_memory = avg_memory
 
         for lib_name, result in sorted(
                 lib_results.items(),
@@ -370,7 +495,7 @@ class BenchmarkRunner:
             perf_indicator = self._generate_performance_indicator(time_factor)
 
             summary_table.add_row(
-                f"[bold {lib.color}]{lib_name}[/]",
+                lib.name_bold_markup,
                 f"[cyan]{result['avg_time'] * 1e6:.2f}[/]",
                 f"[green]{format_memory(result['avg_memory'])}[/]",
                 f"[yellow]{time_factor:.1f}x[/]",
@@ -416,16 +541,15 @@ class BenchmarkRunner:
             performance_bar = self._generate_performance_bar(relative)
 
             if len(result.times) > 1:
-                std_dev = statistics.stdev(result.times)
-                std_dev_str = f"{std_dev * 1e6:.2f} μs"
+                std_dev_str = f"{result.std_time * 1e6:.2f} μs"
             else:
                 std_dev_str = "N/A"
 
             time_table.add_row(
-                f"[{lib.color}]{lib_name}[/]",
+                lib.name_markup,
                 f"{result.avg_time * 1e6:.2f}",
-                f"{min(result.times) * 1e6:.2f}",
-                f"{max(result.times) * 1e6:.2f}",
+                f"{result.min_time * 1e6:.2f}",
+                f"{result.max_time * 1e6:.2f}",
                 std_dev_str,
                 f"{relative:.1f}x",
                 performance_bar
@@ -467,7 +591,7 @@ class BenchmarkRunner:
             efficiency_bar = self._generate_efficiency_bar(relative)
 
             mem_table.add_row(
-                f"[{lib.color}]{lib_name}[/]",
+                lib.name_markup,
                 format_memory(result.avg_memory),
                 format_memory(result.peak_memory),
                 f"{relative:.1f}x",
@@ -531,7 +655,7 @@ class BenchmarkRunner:
             lib = self.libraries[lib_name]
 
             profile_table = Table(
-                title=f"[{lib.color}]{lib_name}[/] - Top Functions",
+                title=f"{lib.name_markup} - Top Functions",
                 box=ROUNDED,
                 show_header=True,
                 header_style=f"bold {lib.color}"
@@ -555,12 +679,15 @@ class BenchmarkRunner:
         filename = filename or self.config['output']
         results = {
             'config': self.config,
-            'scenarios': [s.__dict__ for s in self.scenarios],
+            'scenarios': [
+                {k: v for k, v in s.__dict__.items() if k not in ('argv', 'args')}
+                for s in self.scenarios
+            ],
             'results': {
                 scenario: {
                     lib: {
-                        'times': res.times,
-                        'memory_usage': res.memory_usage
+                        'times': np.asarray(res.times).tolist(),
+                        'memory_usage': np.asarray(res.memory_usage).tolist()
                     }
                     for lib, res in scenario_res.items()
                 }
@@ -573,8 +700,15 @@ class BenchmarkRunner:
             }
         }
 
-        with open(filename, 'w') as f:
-            json.dump(results, f, indent=2)
+        if orjson is not None:
+            with open(filename, 'wb') as f:
+                f.write(orjson.dumps(
+                    results,
+                    option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY
+                ))
+        else:
+            with open(filename, 'w') as f:
+                json.dump(results, f, indent=2)
 
         console.print(f"\n[green]✓ Results saved to {filename}")
 
@@ -593,23 +727,33 @@ class BenchmarkRunner:
         console.print(f"\n[green]✓ Results loaded from {filename}")
 
 
+# Таблицы (порог, множитель/делитель, единица) вместо if/elif-лестниц
+_TIME_UNITS = (
+    (1e-6, 1e9, "ns"),
+    (1e-3, 1e6, "μs"),
+    (1, 1e3, "ms"),
+)
+_MEM_UNITS = (
+    (1024 ** 2, 1024, "KB"),
+    (1024 ** 3, 1024 ** 2, "MB"),
+)
+
+
+@lru_cache(maxsize=2048)
 def format_time(seconds: float) -> str:
-    if seconds < 1e-6:
-        return f"{seconds * 1e9:.2f} ns"
-    elif seconds < 1e-3:
-        return f"{seconds * 1e6:.2f} μs"
-    elif seconds < 1:
-        return f"{seconds * 1e3:.2f} ms"
+    for threshold, scale, unit in _TIME_UNITS:
+        if seconds < threshold:
+            return f"{seconds * scale:.2f} {unit}"
     return f"{seconds:.4f} s"
 
 
+@lru_cache(maxsize=2048)
 def format_memory(bytes_val: int) -> str:
     if bytes_val < 1024:
         return f"{bytes_val} B"
-    elif bytes_val < 1024 ** 2:
-        return f"{bytes_val / 1024:.2f} KB"
-    elif bytes_val < 1024 ** 3:
-        return f"{bytes_val / (1024 ** 2):.2f} MB"
+    for threshold, divisor, unit in _MEM_UNITS:
+        if bytes_val < threshold:
+            return f"{bytes_val / divisor:.2f} {unit}"
     return f"{bytes_val / (1024 ** 3):.2f} GB"
 
 
@@ -668,6 +812,7 @@ def get_complexity_color(complexity: str) -> str:
 
 
 def setup_click() -> Any:
+    import click
 
     @click.group()
     def cli():
@@ -696,6 +841,8 @@ def setup_click() -> Any:
 
 
 def setup_typer() -> Any:
+    import typer
+
     app = typer.Typer()
 
     @app.command()
@@ -719,6 +866,8 @@ def setup_typer() -> Any:
 
 
 def setup_spaceworld() -> Any:
+    import spaceworld
+
     app = spaceworld.SpaceWorld()
 
     @app.command()
@@ -782,41 +931,41 @@ def setup_fire() -> Any:
     return FireApp()
 
 
-def execute_click(cli: Any, command: str) -> None:
-    with mock_argv(["cli", *command.split()]):
-        cli(standalone_mode=False)
+# Аргументы передаются явно, без подмены sys.argv: контекстный менеджер
+# добавлял несколько Python-фреймов в каждую измеряемую итерацию
+def execute_click(cli: Any, scenario: TestScenario) -> None:
+    cli.main(args=scenario.args, standalone_mode=False, prog_name="cli")
 
 
-def execute_typer(app: Any, command: str) -> None:
-    with mock_argv(["cli", *command.split()]):
-        try:
-            app()
-        except SystemExit:
-            pass
+def execute_typer(app: Any, scenario: TestScenario) -> None:
+    try:
+        app(args=scenario.args, standalone_mode=False, prog_name="cli")
+    except SystemExit:
+        pass
 
 
-def execute_spaceworld(cns: Any, command: str) -> None:
-    with mock_argv(["cli", *command.split()]):
-        try:
-            cns()
-        except SystemExit:
-            pass
+def execute_spaceworld(cns: Any, scenario: TestScenario) -> None:
+    try:
+        cns(args=scenario.args)
+    except SystemExit:
+        pass
 
 
-def execute_argparse(parser: Any, command: str) -> None:
-    with mock_argv(["cli", *command.split()]):
-        parser.parse_args()
+def execute_argparse(parser: Any, scenario: TestScenario) -> None:
+    parser.parse_args(scenario.args)
 
 
-def execute_fire(FireApp: Any, command: str) -> None:
-    with mock_argv(["cli", *command.split()]):
-        try:
-            fire.Fire(FireApp)
-        except SystemExit:
-            pass
+def execute_fire(FireApp: Any, scenario: TestScenario) -> None:
+    import fire
+    try:
+        fire.Fire(FireApp, command=scenario.args)
+    except SystemExit:
+        pass
 
 
 def setup_cloup() -> Any:
+    import cloup
+
     @cloup.group()
     def cli():
         pass
@@ -843,24 +992,38 @@ def setup_cloup() -> Any:
     return cli
 
 
-def execute_cloup(cli: Any, command: str) -> None:
+def execute_cloup(cli: Any, scenario: TestScenario) -> None:
     """Выполнение команды Cloup"""
-    with mock_argv(["cli", *command.split()]):
-        try:
-            cli.main()
-        except SystemExit:
-            pass
+    try:
+        cli.main(args=scenario.args, standalone_mode=False, prog_name="cli")
+    except SystemExit:
+        pass
 
 
-@contextmanager
-def mock_argv(args: List[str]):
-    """Контекстный менеджер для подмены sys.argv"""
-    original = sys.argv
-    sys.argv = args
-    try:
-        yield
-    finally:
-        sys.argv = original
+# Реестр фабрик по имени: позволяет подпроцессам пересобирать окружение
+# библиотеки, не перетаскивая незапиклируемые объекты через границу процесса
+LIBRARY_SPECS: Dict[str, Tuple[Callable, Callable]] = {
+    'spaceworld': (setup_spaceworld, execute_spaceworld),
+    'argparse': (setup_argparse, execute_argparse),
+    'click': (setup_click, execute_click),
+    'typer': (setup_typer, execute_typer),
+    'cloup': (setup_cloup, execute_cloup),
+    'fire': (setup_fire, execute_fire),
+}
+
+
+def _run_one(
+        lib_name: str,
+        scenario: TestScenario,
+        runs: int,
+        warmup: int,
+        measure_memory: bool,
+        memory_mode: str = "tracemalloc"
+) -> BenchmarkResult:
+    """Запускает один замер библиотека×сценарий в рабочем подпроцессе"""
+    setup_func, execute_func = LIBRARY_SPECS[lib_name]
+    library = BenchmarkLibrary(lib_name, setup_func, execute_func)
+    return library.run_test(scenario, runs, warmup, measure_memory, memory_mode)
 
 
 def main():
@@ -868,38 +1031,12 @@ def main():
     try:
         runner = BenchmarkRunner()
 
-        runner.add_library(BenchmarkLibrary(
-            "spaceworld",
-            setup_spaceworld,
-            execute_spaceworld
-        ))
-        runner.add_library(BenchmarkLibrary(
-            "argparse",
-            setup_argparse,
-            execute_argparse
-        ))
-
-        runner.add_library(BenchmarkLibrary(
-            "click",
-            setup_click,
-            execute_click
-        ))
-        runner.add_library(BenchmarkLibrary(
-            "typer",
-            setup_typer,
-            execute_typer
-        ))
-
-        runner.add_library(BenchmarkLibrary(
-            "cloup",
-            setup_cloup,
-            execute_cloup
-        ))
-        runner.add_library(BenchmarkLibrary(
-            "fire",
-            setup_fire,
-            execute_fire
-        ))
+        for lib_name, (setup_func, execute_func) in LIBRARY_SPECS.items():
+            runner.add_library(BenchmarkLibrary(
+                lib_name,
+                setup_func,
+                execute_func
+            ))
         runner.config.update({
             'runs': 1,
             'warmup': 1,
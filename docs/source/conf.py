@@ -14,7 +14,6 @@ extensions = [
     'sphinx.ext.intersphinx',  # Ссылки между документациями
     'sphinx.ext.coverage',  # Проверка покрытия документации
     'sphinx.ext.mathjax',  # Поддержка математических формул
-    'sphinx_autodoc_typehints',  # Красивое отображение аннотаций типов
 ]
 
 # -- Настройки проекта ------------------------------------------------------
@@ -36,7 +35,10 @@ autodoc_default_options = {
 
 autodoc_typehints = 'description'
 autodoc_typehints_description_target = 'documented'
-autodoc_mock_imports = []  # Для внешних зависимостей
+autodoc_preserve_defaults = True  # Не перевычислять значения по умолчанию
+# Для внешних зависимостей: пакет пока чисто stdlib, но тяжёлые
+# runtime-зависимости добавлять сюда, чтобы autodoc их не импортировал
+autodoc_mock_imports = []
 
 # -- Настройки Napoleon (Google/Numpy docstrings) ---------------------------
 napoleon_google_docstring = True
@@ -97,10 +99,6 @@ html_js_files = [
     'custom.js',
 ]
 
-# Для лучшего отображения типов
-always_document_param_types = True
-typehints_fully_qualified = False
-
 html_theme_options = {
     "sidebar_hide_name": True,
     "navigation_depth": 4,
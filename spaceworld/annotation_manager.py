@@ -1,11 +1,11 @@
 """The AnnotationManager implementation is a class for annotations in SpaceWorld."""
 
-import inspect
 import types
 import typing
 from datetime import datetime
 from decimal import Decimal
 from enum import Enum
+from inspect import Parameter as _InspectParameter
 from pathlib import Path
 from typing import (
     Any,
@@ -67,7 +67,7 @@ class AnnotationManager:
             str: str,
             bool: self._convert_to_bool,
             Path: Path,
-            inspect.Parameter.empty: lambda x: x,
+            _InspectParameter.empty: lambda x: x,
             Any: lambda x: x,
             None: lambda x: x,
         }
@@ -201,9 +201,9 @@ class AnnotationManager:
         Returns:
             The final value after the transformations
         """
-        transformers = self.transformers
-        if annotation in transformers:
-            func = transformers[annotation]
+        # Один .get вместо пары membership-проверка + выборка
+        func = self.transformers.get(annotation)
+        if func is not None:
             try:
                 return func(arg)
             except Exception as error:
@@ -335,17 +335,18 @@ class AnnotationManager:
         positional_args: Args = []
         keyword_args: Kwargs = {}
         for arg in args:
-            if not arg.startswith("-"):
+            if arg[:1] != "-":
                 positional_args.append(arg)
                 continue
-            if not arg.startswith("--"):
+            if arg[:2] != "--":
                 self._preparing_short_flag(arg, positional_args, keyword_args)
                 continue
-            arg = arg[2:]
-            if "=" in arg:
-                self._preparing_value_flag(arg, keyword_args)
+            # Один C-проход partition вместо проверки "=" in + повторного поиска
+            name, sep, value = arg[2:].partition("=")
+            if sep:
+                self._preparing_value_flag(name, value, keyword_args)
                 continue
-            self._preparing_bool_flag(arg, keyword_args)
+            self._preparing_bool_flag(name, keyword_args)
         return positional_args, keyword_args
 
     @staticmethod
@@ -380,18 +381,18 @@ class AnnotationManager:
         """
         return value.startswith(sym) and value.endswith(sym)
 
-    def _preparing_value_flag(self, arg: Arg, keyword_args: Kwargs) -> None:
+    def _preparing_value_flag(self, name: Arg, value: str, keyword_args: Kwargs) -> None:
         """
         Prepare flags with the value.
 
         Args:
-            arg(): Argument
+            name(): Flag name (without the leading dashes)
+            value(): Raw flag value
             keyword_args (): Dictionary of arguments
 
         Returns:
             None
         """
-        name, _, value = arg.partition("=")
         if not name:
             raise ValueError("Invalid flag name: Empty name")
         vl = value.lower()
@@ -538,11 +539,13 @@ class AnnotationManager:
         Returns:
             None
         """
-        new_args_positional += (
-            [self.annotate(prm.annotation, arg) for arg in new_args]
-            if prm.annotation != prm.empty
-            else new_args
-        )
+        if prm.annotation != prm.empty:
+            annotation = prm.annotation
+            new_args_positional.extend(
+                self.annotate(annotation, arg) for arg in new_args
+            )
+        else:
+            new_args_positional.extend(new_args)
 
     def preparing_var_keyword(
         self, lst: Kwargs, new_args_keyword: NewKwargs, prm: Parameter
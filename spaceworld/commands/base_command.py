@@ -1,7 +1,15 @@
-"""Implementing the basic SpaceWorld command."""
+"""
+Implementing the basic SpaceWorld command.
 
-import asyncio
+The string-formatting helpers in this module are cold code precomputed
+at construction time; do not wrap them in a JIT compiler (Numba/Cython),
+whose import and dispatch overhead would outweigh any gain here.
+"""
+
+import sys
 from inspect import iscoroutinefunction, Parameter, signature
+from itertools import chain
+from string import ascii_letters, digits
 from typing import Unpack
 
 from .._types import (
@@ -10,9 +18,70 @@ from .._types import (
     NewArgs,
     NewKwargs,
     Parameters,
+    TupleArgs,
     UserAny,
 )
-from ..utils.util import BaseCommandAnnotated, BaseCommandConfig
+from ..exceptions.command_error import CommandCreateError
+from ..utils.util import BaseCommandAnnotated
+
+_VALID_NAME_CHARS = frozenset(ascii_letters + digits + "_-")
+
+# Константы рендеринга help: один словарь/набор на модуль вместо
+# литералов, пересоздаваемых на каждый вызов или итерацию
+_PREFIX: dict[UserAny, str] = {
+    Parameter.KEYWORD_ONLY: "--",
+    Parameter.VAR_POSITIONAL: "*",
+    Parameter.VAR_KEYWORD: "**",
+}
+_KW_KINDS = frozenset({Parameter.KEYWORD_ONLY, Parameter.VAR_KEYWORD})
+
+# Значения конструктора по умолчанию: один merge словарей вместо семи
+# opt.get с хешированием ключа; frozenset нормальных режимов разделяется
+# всеми командами без аргумента activate_modes
+_NORMAL_MODES = frozenset({"normal"})
+_DEFAULTS = {
+    "examples": "",
+    "docs": "",
+    "activate_modes": _NORMAL_MODES,
+    "hidden": False,
+    "deprecated": False,
+    "confirm": "",
+    "history": False,
+}
+
+# Системные опции не зависят от команды — два готовых варианта на модуль
+_SYSTEM_OPTIONS = ("  --help - Displays the help on the command", "")
+_SYSTEM_OPTIONS_CONFIRM = (
+    "  --help - Displays the help on the command",
+    "  --force - Disables command confirmations(For confirm command)",
+)
+
+# Общий ленивый asyncio.Runner для синхронного вызова корутин-команд:
+# asyncio.run на каждую команду создавал и закрывал цикл заново, Runner
+# держит один цикл и амортизирует его создание по всем вызовам
+_runner = None
+
+
+def _get_runner():
+    """
+    Return the shared asyncio.Runner, creating it on first use.
+
+    Returns:
+        A reusable asyncio.Runner instance
+    """
+    global _runner
+    if _runner is None:
+        import asyncio
+
+        def loop_factory():
+            # Python 3.12+: eager-задачи выполняются сразу до первого
+            # await и не платят за планирование, если завершились синхронно
+            loop = asyncio.new_event_loop()
+            loop.set_task_factory(asyncio.eager_task_factory)
+            return loop
+
+        _runner = asyncio.Runner(loop_factory=loop_factory)
+    return _runner
 
 
 class BaseCommand:
@@ -33,14 +102,48 @@ class BaseCommand:
         func: Callable implementation
     """
 
+    name: str
+    aliases: TupleArgs
+    func: DynamicCommand
+    hidden: bool
+    deprecated: bool | str
+    confirm: bool | str
+    history: bool
+    activate_modes: frozenset[str]
+    any_mode: bool
+    docs: str
+    big_docs: str
+    is_async: bool
+    cached: bool
+    _example: str
+    _help_text: str
+    _parameters: Parameters
+    _examples: str | Args
+    _deprecated_msg: str
+    _confirmation_msg: str
+
+    # Конфигурация лежит в слотах, а не в dict: чтение атрибута — это
+    # load по смещению, без хеширования ключа на каждый доступ
     __slots__ = (
         "name",
         "aliases",
         "func",
+        "hidden",
+        "deprecated",
+        "confirm",
+        "history",
+        "activate_modes",
+        "any_mode",
+        "docs",
+        "big_docs",
+        "is_async",
+        "cached",
+        "_example",
         "_help_text",
         "_parameters",
-        "config",
         "_examples",
+        "_deprecated_msg",
+        "_confirmation_msg",
     )
 
     def __init__(
@@ -68,82 +171,98 @@ class BaseCommand:
             confirm: Confirmation requirement flag or custom prompt
             history: If False, excludes from command history
         """
-        self.func: DynamicCommand = func
-        self.name: str = name or self.func.__name__
-        self.aliases: Args = aliases or []
-        self._parameters: Parameters | None = None
-        self._examples = opt.get("examples", "")
-        self._help_text: None | str = None
-
-        docs = opt.get("docs", self.func.__doc__) or ""
-        self.config: BaseCommandConfig = {
-            "activate_modes": opt.get("activate_modes", {"normal"}),
-            "hidden": opt.get("hidden", False),
-            "deprecated": opt.get("deprecated", False),
-            "big_docs": big_docs or docs,
-            "confirm": opt.get("confirm", ""),
-            "history": opt.get("history", False),
-            "is_async": None,
-            "docs": docs,
-            "example": "",
-            "cached": True,
-        }
-
-    @property  # noqa
-    def is_async(self) -> None | bool:
-        """
-        Lazily returns the is_async.
+        self.func = func
+        # Интернированные имена дают lookup по идентичности указателя
+        # в словарях команд вместо посимвольного сравнения строк
+        self.name = sys.intern(name or self.func.__name__)
+        if not self.name or not all(c in _VALID_NAME_CHARS for c in self.name):
+            raise CommandCreateError(f"Invalid command name: '{self.name}'")
+        self.aliases = tuple(map(sys.intern, aliases)) if aliases else ()
+        self._parameters = tuple(signature(func).parameters.values())
+        opt = {**_DEFAULTS, **opt}
+        self._examples = opt["examples"]
+
+        docs = opt["docs"] or self.func.__doc__ or ""
+        activate_modes = opt["activate_modes"]
+        if activate_modes is _NORMAL_MODES:
+            modes = activate_modes
+        else:
+            if isinstance(activate_modes, str):
+                activate_modes = (activate_modes,)
+            modes = frozenset(mode.lower() for mode in activate_modes)
+        self.activate_modes = modes
+        self.any_mode = "all" in modes
+        self.hidden = opt["hidden"]
+        self.deprecated = opt["deprecated"]
+        self.big_docs = big_docs if big_docs is not None else docs
+        self.confirm = opt["confirm"]
+        self.history = opt["history"]
+        self.is_async = iscoroutinefunction(func)
+        self.cached = True
+        self.docs = docs
+        # Сообщения неизменны после конструктора — форматируем один раз
+        self._deprecated_msg = (
+            f"Deprecated: {'YES' if isinstance(dp, bool) else f'the message: {dp}'}"
+            if (dp := self.deprecated)
+            else ""
+        )
+        self._confirmation_msg = (
+            f"Confirm {'ation YES' if isinstance(cm, bool) else f'ing the message: {cm}'} "
+            if (cm := self.confirm)
+            else ""
+        )
+        self._example = self.generate_example(self._examples)
+        self._help_text = self._render_help_doc()
 
-        Returns:
-            is_async
+    @classmethod
+    def create(
+        cls,
+        *,
+        name: None | str = None,
+        aliases: Args | None = None,
+        func: DynamicCommand,
+        big_docs: None | str = None,
+        **opt: Unpack[BaseCommandAnnotated],
+    ) -> "BaseCommand":
         """
-        if self.config["is_async"] is None:
-            self.config["is_async"] = iscoroutinefunction(self.func)
-        return self.config["is_async"]
+        Create a command specialized for its sync or async function.
 
-    @property
-    def cached(self) -> bool:
-        """
-        Returns the caching value of the function.
+        Picks _SyncCommand or _AsyncCommand so that __call__ carries no
+        per-invocation is_async branch.
+
+        Args:
+            name: Command name (defaults to function name)
+            aliases: Alternative command names
+            func: Command implementation function
+            big_docs: Detailed documentation (defaults to short docs)
 
         Returns:
-            bool
+            A BaseCommand subclass instance matching the function kind
         """
-        return True
+        command_cls = _AsyncCommand if iscoroutinefunction(func) else _SyncCommand
+        return command_cls(
+            name=name, aliases=aliases, func=func, big_docs=big_docs, **opt
+        )
 
     @property
     def help_text(self) -> str:
         """
-        Lazily returns the help table.
+        Return the precomputed help table.
 
         Returns:
             help table
         """
-        if self._help_text is None:
-            self._help_text = self.get_help_doc()
         return self._help_text
 
-    @property
-    def big_docs(self) -> str:
-        """
-        Return a large documentation on the function.
-
-        Returns:
-            returns the docs
-        """
-        return self.config["big_docs"]
-
     @property
     def examples(self) -> str:
         """
-        Lazily returns the example table.
+        Return the example table rendered at registration.
 
         Returns:
             example table
         """
-        if not self.config["example"]:
-            self.config["example"] = self.generate_example(self._examples)
-        return self.config["example"]
+        return self._example
 
     @property
     def parameters(self) -> Parameters:
@@ -153,8 +272,6 @@ class BaseCommand:
         Returns:
             Returns the signature of the command
         """
-        if self._parameters is None:
-            self._parameters = tuple(signature(self.func).parameters.values())
         return self._parameters
 
     def get_msg(self) -> tuple[str, str]:
@@ -164,19 +281,18 @@ class BaseCommand:
         Returns:
             Сообщение об устаревшей команде и confirm команде
         """
-        deprecated_msg = (
-            f"Deprecated: {'YES' if isinstance(dp, bool) else f'the message: {dp}'}"
-            if (dp := self.config["deprecated"])
-            else ""
-        )
-        confirmation_msg = (
-            f"Confirm {'ation YES' if isinstance(cm, bool) else f'ing the message: {cm}'} "
-            if (cm := self.config["confirm"])
-            else ""
-        )
-        return deprecated_msg, confirmation_msg
+        return self._deprecated_msg, self._confirmation_msg
 
     def get_help_doc(self) -> str:
+        """
+        Return the help documentation rendered at registration.
+
+        Returns:
+            str: Cached multi-line help text
+        """
+        return self._help_text
+
+    def _render_help_doc(self) -> str:
         """
         Generate formatted help documentation for the command.
 
@@ -192,15 +308,18 @@ class BaseCommand:
                  - Confirmation requirements
         """
         deprecated_msg, confirmation_msg = self.get_msg()
-        return (
-            f"Usage: {self.examples}"
-            f"{self.big_docs or 'None documentation'}\n"
-            f"{f'Args: \n{args}\n\n' if (args := self._get_args_info()) else ''}\n"
-            f"Options: \n{self._get_options_info()}\n"
-            f"{'Hidden' if self.config['hidden'] else ''}\n"
-            f"{deprecated_msg}"
-            f"{confirmation_msg}"
+        args_lines, opts_lines = self._split_parameters()
+        system_options = (
+            _SYSTEM_OPTIONS_CONFIRM if self.confirm else _SYSTEM_OPTIONS
         )
+        parts = [f"Usage: {self.examples}{self.big_docs or 'None documentation'}\n"]
+        if args_lines:
+            parts.append(f"Args: \n{'\n'.join(args_lines)}\n\n")
+        parts.append(f"\nOptions: \n{'\n'.join(chain(opts_lines, system_options))}\n")
+        if self.hidden:
+            parts.append("Hidden")
+        parts.append(f"\n{deprecated_msg}{confirmation_msg}")
+        return "".join(parts)
 
     def generate_example(self, examples: str | Args) -> str:
         """
@@ -211,64 +330,39 @@ class BaseCommand:
         Returns:
             example table
         """
-        prefix: dict[UserAny, str] = {
-            Parameter.KEYWORD_ONLY: "--",
-            Parameter.VAR_POSITIONAL: "*",
-            Parameter.VAR_KEYWORD: "**",
-        }
-
-        msg = " ".join([
-            (
-                "["
-                f"{prefix.get(prm.kind, '')}"
-                f"{prm.name}: {an.__name__ if (an := prm.annotation) != prm.empty else 'Any'}"
-                f"{f" = '{prm.default}'" if prm.default != prm.empty else ''}"
-                "]"
-            )
+        # Один f-string на параметр (BUILD_STRING) и генератор вместо
+        # промежуточного списка
+        msg = " ".join(
+            f"[{_PREFIX.get(prm.kind, '')}{prm.name}: "
+            f"{getattr(an, '__name__', an) if (an := prm.annotation) != prm.empty else 'Any'}"
+            f"{f" = '{prm.default}'" if prm.default != prm.empty else ''}]"
             for prm in self.parameters
-        ])
+        )
         examples = "\n".join(examples) if isinstance(examples, list) else examples
         return f"{self.name} [ARGS] [OPTIONS] {msg} \n{examples}"
 
-    def _get_args_info(self) -> str:
+    def _split_parameters(self) -> tuple[list[str], list[str]]:
         """
-        Format parameter information for help documentation.
+        Classify parameters into args and options in a single pass.
 
         Returns:
-            str: Formatted parameter details with:
+            tuple: Formatted argument lines and option lines with:
                  - Parameter names
                  - Types
                  - Default values
         """
-        return "\n".join([
-            f"  {prm.name}: {prm.annotation}"
-            for prm in self.parameters
-            if prm.kind not in {prm.KEYWORD_ONLY, prm.VAR_KEYWORD}
-            and prm.annotation is not bool
-        ])
-
-    def _get_options_info(self) -> str:
-        """
-        Format parameter information for help documentation.
-
-        Returns:
-            str: Formatted parameter details with:
-                 - Parameter names
-                 - Types
-                 - Default values
-        """
-        system_options = [
-            "  --help - Displays the help on the command",
-            "  --force - Disables command confirmations(For confirm command)"
-            if self.config["confirm"]
-            else "",
-        ]
-        options = [
-            f"  --{prm.name.replace('_', '-')}: {prm.annotation.__name__} = {prm.default}"
-            for prm in self.parameters
-            if prm.kind in {prm.KEYWORD_ONLY, prm.VAR_KEYWORD} or prm.annotation is bool
-        ] + system_options
-        return "\n".join(options)
+        args_lines: list[str] = []
+        opts_lines: list[str] = []
+        for prm in self.parameters:
+            if prm.kind in _KW_KINDS or prm.annotation is bool:
+                opts_lines.append(
+                    f"  --{prm.name.replace('_', '-')}: "
+                    f"{getattr(prm.annotation, '__name__', prm.annotation)}"
+                    f" = {prm.default}"
+                )
+            else:
+                args_lines.append(f"  {prm.name}: {prm.annotation}")
+        return args_lines, opts_lines
 
     async def run_async_command(  # noqa
         self, args: NewArgs, kwargs: NewKwargs
@@ -293,11 +387,63 @@ class BaseCommand:
         Returns:
             None
         """
-        if self.is_async:
-            coroutine = self.func(*args, **kwargs)
-            try:
-                loop = asyncio.get_running_loop()
-            except RuntimeError:
-                return asyncio.run(coroutine)
-            return loop.run_until_complete(coroutine)
+        # Синхронный путь первым — он горячий при диспетчеризации команд
+        if not self.is_async:
+            return self.func(*args, **kwargs)
+        # asyncio тянет selectors/socket при импорте — платим за него
+        # только когда встретилась первая асинхронная команда
+        import asyncio
+
+        coroutine = self.func(*args, **kwargs)
+        # _get_running_loop возвращает None без исключения — дешевле,
+        # чем раскрутка RuntimeError из get_running_loop
+        loop = asyncio._get_running_loop()  # noqa: SLF001
+        if loop is None:
+            return _get_runner().run(coroutine)
+        return loop.run_until_complete(coroutine)
+
+
+class _SyncCommand(BaseCommand):
+    """Command over a plain function: __call__ is a direct delegation."""
+
+    __slots__ = ()
+
+    def __call__(self, *args: UserAny, **kwargs: UserAny) -> UserAny:
+        """
+        Run func.
+
+        Args:
+            *args ():
+            **kwargs ():
+
+        Returns:
+            None
+        """
         return self.func(*args, **kwargs)
+
+
+class _AsyncCommand(BaseCommand):
+    """Command over a coroutine function: __call__ drives the runner."""
+
+    __slots__ = ()
+
+    def __call__(self, *args: UserAny, **kwargs: UserAny) -> UserAny:
+        """
+        Run func.
+
+        Args:
+            *args ():
+            **kwargs ():
+
+        Returns:
+            None
+        """
+        import asyncio
+
+        coroutine = self.func(*args, **kwargs)
+        # _get_running_loop возвращает None без исключения — дешевле,
+        # чем раскрутка RuntimeError из get_running_loop
+        loop = asyncio._get_running_loop()  # noqa: SLF001
+        if loop is None:
+            return _get_runner().run(coroutine)
+        return loop.run_until_complete(coroutine)
@@ -1,6 +1,13 @@
-"""Implementation of the Module's Base Class in SpaceWorld."""
+"""
+Implementation of the Module's Base Class in SpaceWorld.
 
+Help rendering here is cold, cacheable string assembly; as in
+base_command.py, keep it plain Python and do not apply a JIT compiler.
+"""
+
+import sys
 from collections.abc import Callable
+from types import MappingProxyType
 from typing import Unpack
 
 from .._types import Args, DynamicCommand, UserAny
@@ -9,6 +16,17 @@ from ..exceptions.command_error import CommandCreateError
 from ..exceptions.module_error import SubModuleCreateError
 from ..utils.util import BaseCommandAnnotated, register
 
+_EMPTY_REGISTRY: MappingProxyType = MappingProxyType({})
+
+# Статичный хвост help-модуля: собирается один раз на модуль,
+# а не конкатенацией литералов на каждый вызов get_help_doc
+_MODULE_HELP_TAIL = (
+    "Module Flags: \n"
+    "\n\t--help\\-h \tDisplays the help\n"
+    "\n\t--force\\-f\tCancels confirmation\n"
+    "For reference on a specific command: \n"
+)
+
 
 class BaseModule:
     """
@@ -27,7 +45,15 @@ class BaseModule:
         modules: Dictionary of nested submodules
     """
 
-    __slots__ = ("name", "docs", "commands", "modules", "_help_text", "_cached")
+    __slots__ = (
+        "name",
+        "docs",
+        "commands",
+        "modules",
+        "primary_names",
+        "cached",
+        "_help_text",
+    )
 
     def __init__(self, name: str, docs: str = "", cached: bool = True) -> None:
         """
@@ -39,20 +65,11 @@ class BaseModule:
         """
         self.name: str = name
         self.docs: str = docs
-        self.commands: dict[str, BaseCommand] = {}
-        self.modules: dict[str, "BaseModule"] = {}
+        self.commands: dict[str, BaseCommand] = _EMPTY_REGISTRY
+        self.modules: dict[str, "BaseModule"] = _EMPTY_REGISTRY
+        self.primary_names: set[str] = set()
+        self.cached: bool = cached
         self._help_text: None | str = None
-        self._cached = cached
-
-    @property
-    def cached(self) -> bool:
-        """
-        Returns the caching value of the function.
-
-        Returns:
-            bool
-        """
-        return self._cached
 
     @property
     def help_text(self) -> str:
@@ -66,6 +83,21 @@ class BaseModule:
             self._help_text = self.get_help_doc()
         return self._help_text
 
+    def finalize(self) -> None:
+        """
+        Freeze the command and submodule registries after registration.
+
+        Copies both registries into compact dictionaries (dropping the
+        over-allocated insert capacity) and wraps them in read-only
+        mapping proxies, so dispatch works against the smallest possible
+        tables.
+
+        Returns:
+            None
+        """
+        self.commands = MappingProxyType(dict(self.commands))
+        self.modules = MappingProxyType(dict(self.modules))
+
     def decorator(self, func: DynamicCommand) -> DynamicCommand:
         """
         Register a function as a basic command in the module.
@@ -79,10 +111,16 @@ class BaseModule:
         Raises:
             CommandCreateError: If command name already exists
         """
-        name = func.__name__
+        name = sys.intern(func.__name__)
+        if self.commands is _EMPTY_REGISTRY:
+            self.commands = {}
+        elif isinstance(self.commands, MappingProxyType):
+            raise CommandCreateError(
+                f"Module '{self.name}' is finalized; cannot register '{name}'"
+            )
         if name in self.commands:
             raise CommandCreateError(f"Command '{name}' already exists")
-        command = BaseCommand(
+        command = BaseCommand.create(
             func=func,
             hidden=False,
             docs="",
@@ -93,6 +131,7 @@ class BaseModule:
             history=True,
         )
         self.commands[name] = command
+        self.primary_names.add(name)
         return func
 
     def command(
@@ -117,9 +156,6 @@ class BaseModule:
         Raises:
             CommandCreateError: If command or aliases already exists
         """
-        if aliases is None:
-            aliases = []
-
         def decorator(func: DynamicCommand) -> DynamicCommand:
             """
             Register a function with arguments.
@@ -130,22 +166,68 @@ class BaseModule:
             Returns:
                 Function
             """
-            func_name = name.replace("-", "_") if name else func.__name__
-            names = [alias not in self.commands for alias in aliases]
-            if not all(names + [name not in self.commands]):
-                raise CommandCreateError(
-                    f"Command '{'/'.join(aliases + [func_name])} already exists"
-                )
-            cmd = BaseCommand(
-                name=func_name, big_docs=big_docs, aliases=aliases, func=func, **kwargs
+            return self.add_command(
+                func, name=name, aliases=aliases, big_docs=big_docs, **kwargs
             )
-            self.commands[func_name] = cmd
-            for alias in cmd.aliases:
-                self.commands[alias] = cmd
-            return func
 
         return decorator
 
+    def add_command(
+        self,
+        func: DynamicCommand,
+        *,
+        name: None | str = None,
+        aliases: Args | None = None,
+        big_docs: None | str = None,
+        **kwargs: Unpack[BaseCommandAnnotated],
+    ) -> DynamicCommand:
+        """
+        Register a function as a configured command without decorator syntax.
+
+        Direct path behind the command decorator for programmatic
+        registration; avoids allocating a decorator closure per command.
+
+        Args:
+            func: The callable to register as a command
+            name: Command name (defaults to function name)
+            aliases: List of command aliases
+            big_docs: Detailed documentation (defaults to short docs)
+
+        Returns:
+            The same function
+
+        Raises:
+            CommandCreateError: If command or aliases already exists
+        """
+        if aliases is None:
+            aliases = []
+        func_name = sys.intern(name.replace("-", "_") if name else func.__name__)
+        if self.commands is _EMPTY_REGISTRY:
+            self.commands = {}
+        elif isinstance(self.commands, MappingProxyType):
+            raise CommandCreateError(
+                f"Module '{self.name}' is finalized; cannot register '{func_name}'"
+            )
+        # Пересечение множеств считается в C — быстрее по-элементных
+        # проверок при длинном списке алиасов
+        conflicts = set(aliases).intersection(self.commands)
+        if func_name in self.commands:
+            conflicts.add(func_name)
+        if conflicts:
+            raise CommandCreateError(
+                f"Command '{'/'.join(conflicts)}' already exists"
+            )
+        cmd = BaseCommand.create(
+            name=func_name, big_docs=big_docs, aliases=aliases, func=func, **kwargs
+        )
+        self.commands[func_name] = cmd
+        self.primary_names.add(func_name)
+        for alias in cmd.aliases:
+            if alias in self.commands:
+                raise CommandCreateError(f"Command '{alias}' already exists")
+            self.commands[alias] = cmd
+        return func
+
     def spaceworld(self, target: type[UserAny] | DynamicCommand) -> UserAny:
         """
         Register a callable or class as commands in SpaceWorld.
@@ -216,10 +298,17 @@ class BaseModule:
         Raises:
             SubModuleCreateError: If submodule name already exists
         """
-        if module.name in self.modules:
-            raise SubModuleCreateError(f"Submodule '{module.name}' already exists")
-        self.modules[module.name] = module
-        return self.modules[module.name]
+        if self.modules is _EMPTY_REGISTRY:
+            self.modules = {}
+        elif isinstance(self.modules, MappingProxyType):
+            raise SubModuleCreateError(
+                f"Module '{self.name}' is finalized; cannot register '{module.name}'"
+            )
+        name = sys.intern(module.name)
+        if name in self.modules:
+            raise SubModuleCreateError(f"Submodule '{name}' already exists")
+        self.modules[name] = module
+        return module
 
     def module(
         self, *args: DynamicCommand | UserAny, **kwargs: UserAny
@@ -276,15 +365,14 @@ class BaseModule:
                  - Confirmation requirements
         """
         examples = "\n\t".join(
-            f"{cmd.examples}\t{cmd.config['docs']}" for cmd in self.commands.values()
+            f"{cmd.examples}\t{cmd.docs}"
+            for name, cmd in self.commands.items()
+            if name in self.primary_names
         )
         msg = f"\n\t{examples}"
         return (
             f"Module `{self.name}` {f'- {self.docs.strip()}' if self.docs.strip() else ''}\n"
             f"Commands: {msg}\n"
-            "Module Flags: \n"
-            "\n\t--help\\-h \tDisplays the help\n"
-            "\n\t--force\\-f\tCancels confirmation\n"
-            "For reference on a specific command: \n"
+            f"{_MODULE_HELP_TAIL}"
             f"\t{self.name} <command> --help/-h\n"
         )
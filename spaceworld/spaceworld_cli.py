@@ -49,6 +49,8 @@ class SpaceWorld:
         "handlers",
         "docs",
         "versions",
+        "_command_index",
+        "_help_cache",
     )
 
     def __init__(
@@ -89,6 +91,10 @@ class SpaceWorld:
         self.versions = versions
         self.handlers: dict[str, Callable[..., None | ExitError | UserAny | Never]] = {}
         self.command_cache: dict[TupleArgs, CommandCacheEntry] = {}
+        self._command_index: (
+            dict[TupleArgs, tuple[BaseCommand, None | BaseModule]] | None
+        ) = None
+        self._help_cache: None | str = None
         self.di: AnnotationManager = AnnotationManager()
         self.writer: Writer = writer or MyWriter()
         self.confirmation_command: TupleArgs | None = None
@@ -167,9 +173,6 @@ class SpaceWorld:
         Raises:
             CommandCreateError: If command name or aliases already exists
         """
-        if aliases is None:
-            aliases = []
-
         def decorator(func: DynamicCommand) -> DynamicCommand:
             """
             Register and returns a function.
@@ -180,21 +183,57 @@ class SpaceWorld:
             Returns:
                 The same Function
             """
-            func_name = (
-                name.replace("-", "_") if name else func.__name__.replace("-", "_")
+            return self.add_command(
+                func, name=name, aliases=aliases, big_docs=big_docs, **kwargs
             )
-            names = aliases + [func_name]
-            if all(name in self.commands for alias in names):
-                raise CommandCreateError(f"Command '{'/'.join(names)} already exists")
-            command = BaseCommand(
-                name=func_name, aliases=aliases, big_docs=big_docs, func=func, **kwargs
-            )
-            for alias in names:
-                self.commands[alias] = command
-            return func
 
         return decorator
 
+    def add_command(
+        self,
+        func: DynamicCommand,
+        *,
+        name: None | str = None,
+        aliases: Args | None = None,
+        big_docs: None | str = None,
+        **kwargs: Unpack[BaseCommandAnnotated],
+    ) -> DynamicCommand:
+        """
+        Register a function as a command without decorator syntax.
+
+        This is the direct path behind the command decorator: bulk or
+        programmatic registration can call it with an existing function
+        object and skip the decorator-closure allocation.
+
+        Args:
+            func: The callable to register as a command
+            name: Command name (defaults to function name)
+            aliases: Alternative command names (default: [])
+            big_docs: Detailed documentation (defaults to short docs)
+
+        Returns:
+            The same function
+
+        Raises:
+            CommandCreateError: If command name or aliases already exists
+        """
+        if aliases is None:
+            aliases = []
+        func_name = sys.intern(
+            name.replace("-", "_") if name else func.__name__.replace("-", "_")
+        )
+        names = aliases + [func_name]
+        if any(alias in self.commands for alias in names):
+            raise CommandCreateError(f"Command '{'/'.join(names)}' already exists")
+        command = BaseCommand.create(
+            name=func_name, aliases=aliases, big_docs=big_docs, func=func, **kwargs
+        )
+        for alias in names:
+            self.commands[sys.intern(alias)] = command
+        self._command_index = None
+        self._help_cache = None
+        return func
+
     def spaceworld(
         self, target: type[UserAny] | DynamicCommand
     ) -> UserAny | DynamicCommand:
@@ -274,6 +313,8 @@ class SpaceWorld:
             self.modules |= obj.modules
             self.commands |= obj.commands
             self.di.transformers |= obj.di.transformers
+            self._command_index = None
+            self._help_cache = None
             return obj
         raise TypeError(f"Dont Support Type: {type(obj)}")
 
@@ -299,12 +340,15 @@ class SpaceWorld:
         """
         if not isinstance(module, BaseModule):
             raise ModuleCreateError("The provided object is not a BaseModule instance")
-        name = module.name
-        if module.name in self.modules:
+        # Интернированный ключ — сравнение указателей при поиске модуля
+        name = sys.intern(module.name)
+        if name in self.modules:
             raise ModuleCreateError(
                 f"A module with name '{name}' is already registered"
             )
         self.modules[name] = module
+        self._command_index = None
+        self._help_cache = None
         return module
 
     def _register_command(self, func: DynamicCommand) -> DynamicCommand:
@@ -327,10 +371,10 @@ class SpaceWorld:
             - For more control over command properties, use the @command decorator instead
             - The created command will be active in all operation modes ('all')
         """
-        func_name = func.__name__.replace("-", "_")
+        func_name = sys.intern(func.__name__.replace("-", "_"))
         if func_name in self.commands:
             raise CommandCreateError(f"Command '{func_name}' already exists")
-        self.commands[func_name] = BaseCommand(
+        self.commands[func_name] = BaseCommand.create(
             name=func_name,
             func=func,
             activate_modes={"all"},
@@ -341,6 +385,8 @@ class SpaceWorld:
             deprecated=False,
             hidden=False,
         )
+        self._command_index = None
+        self._help_cache = None
         return func
 
     def error_handler(self, error: type[Exception]) -> None:
@@ -405,17 +451,20 @@ class SpaceWorld:
         return _wraps
 
     def help_handler(self) -> None:
-        examples_command = "\n\t".join(
-            f"{cmd.examples}\t{cmd.config['docs']}" for cmd in self.commands.values()
-        )
-        examples_module = "\n\t".join(
-            f"{cmd.examples}\t{cmd.config['docs']}" for cmd in self.modules.values()
-        )
-        msg = f"\n\t{examples_command}"
-        msg_ = f"\n\t{examples_module}"
+        # Список команд — чистая функция статичных метаданных: собираем один
+        # раз, сбрасываем кеш при регистрации
+        if self._help_cache is None:
+            examples_command = "\n\t".join(
+                f"{cmd.examples}\t{cmd.docs}"
+                for cmd in self.commands.values()
+            )
+            examples_module = "\n\t".join(
+                f"{module.name}\t{module.docs}" for module in self.modules.values()
+            )
+            msg = f"\n\t{examples_command}"
+            msg_ = f"\n\t{examples_module}"
 
-        self.writer.write(
-            (
+            self._help_cache = (
                 f"{self.name} "
                 f"{f'- {self.docs.strip()}' if self.docs.strip() else ''} "
                 f"{self.versions if self.versions.strip() else ''}\n"
@@ -426,7 +475,7 @@ class SpaceWorld:
                 "\n\t--force\\-f\tCancels confirmation\n\n"
                 "For reference on a specific command: \n"
             )
-        )
+        self.writer.write(self._help_cache)
 
     def execute(self, command: TupleArgs | Args) -> UserAny | None:
         """
@@ -453,7 +502,7 @@ class SpaceWorld:
             self.get_handler("help")()
             return None
 
-        if self.confirmation_command:
+        if self.confirmation_command is not None:
             self._handle_confirmation(command)
             return None
 
@@ -509,7 +558,7 @@ class SpaceWorld:
             - Requires confirmation for sensitive commands unless bypassed
         """
         commands: CommandCacheEntry = self._get_command_cache(command)
-        args: TupleArgs = tuple(commands["args"])
+        args: TupleArgs = commands["args"]
         cmd: None | BaseCommand = commands["command"]
         module: None | BaseModule = commands["module"]
 
@@ -559,7 +608,7 @@ class SpaceWorld:
             args = sys.argv[1:]
         try:
             self.execute(tuple(args))
-            while self.confirmation_command:
+            while self.confirmation_command is not None:
                 user_input = input(">>> ")
                 self.execute(tuple(shlex.split(user_input)))
         except KeyboardInterrupt:
@@ -628,7 +677,7 @@ class SpaceWorld:
     def _handle_confirm(
         self, cmd: BaseCommand, confirmation: bool, command: TupleArgs
     ) -> None:
-        if cmd.config["confirm"] and not confirmation:
+        if cmd.confirm and not confirmation:
             self._set_confirm_command(command, cmd)
             raise ExitError
 
@@ -642,10 +691,17 @@ class SpaceWorld:
         Returns:
             Ready-made cached arguments
         """
-        args = tuple(args)
-        if args not in self.command_cache:
-            self.command_cache[args] = self._search_command(args)
-        return self.command_cache[args]
+        # Кортеж не пересобираем, если аргументы уже пришли кортежем
+        if type(args) is not tuple:
+            args = tuple(args)
+        entry = self.command_cache.get(args)
+        if entry is None:
+            entry = self._search_command(args)
+            # Остаток аргументов фиксируем кортежем один раз при записи,
+            # чтобы execute_command не конвертировал его на каждый вызов
+            entry["args"] = tuple(entry["args"])
+            self.command_cache[args] = entry
+        return entry
 
     def _write_deprecated(self, cmd: BaseCommand) -> None:
         """
@@ -656,7 +712,7 @@ class SpaceWorld:
         Returns:
             None
         """
-        deprecated = cmd.config["deprecated"]
+        deprecated = cmd.deprecated
         if deprecated:
             self.writer.warning(deprecated)
 
@@ -673,8 +729,8 @@ class SpaceWorld:
         """
         if not cmd:
             return False
-        modes = cmd.config["activate_modes"]
-        return "all" not in modes  # and self.mode not in modes
+        # Флаг посчитан при регистрации: без повторного поиска по множеству
+        return not cmd.any_mode  # and self.mode not in modes
 
     def _is_cached(
         self, args: TupleArgs, cmd: None | BaseCommand, module: None | BaseModule
@@ -747,10 +803,65 @@ class SpaceWorld:
             - This is an internal method used by the command execution system
             - Handles both simple commands and module-qualified commands
             - Maintains separation between command and arguments
-            - Uses depth-first search through module hierarchy
+            - Uses a flat path index with a tree walk as fallback
         """
         first_arg, *args = command
-        first_arg = first_arg.replace("-", "_")
+        first_arg = sys.intern(first_arg.replace("-", "_"))
+        index = self._command_index
+        if index is None:
+            index = self._command_index = self._build_command_index()
+        parts = (first_arg, *args)
+        # Короткий префикс побеждает: команда затеняет одноимённый модуль,
+        # как и при обходе дерева
+        for i in range(1, len(parts) + 1):
+            hit = index.get(parts[:i])
+            if hit is not None:
+                return {
+                    "command": hit[0],
+                    "args": list(parts[i:]),
+                    "module": hit[1],
+                }
+        # Промах по индексу: обход покрывает команды, зарегистрированные
+        # в модуле уже после его подключения, и собирает ответ о промахе
+        return self._walk_command(first_arg, args)
+
+    def _build_command_index(
+        self,
+    ) -> dict[TupleArgs, tuple[BaseCommand, None | BaseModule]]:
+        """
+        Build a flat index of every command keyed by its full path.
+
+        One walk over the module tree at first lookup replaces the
+        per-dispatch descent; registration resets the index to None.
+
+        Returns:
+            Mapping of path tuples to (command, owning module) pairs
+        """
+        index: dict[TupleArgs, tuple[BaseCommand, None | BaseModule]] = {
+            (name,): (cmd, None) for name, cmd in self.commands.items()
+        }
+        stack: list[tuple[TupleArgs, BaseModule]] = [
+            ((name,), module) for name, module in self.modules.items()
+        ]
+        while stack:
+            path, module = stack.pop()
+            for name, cmd in module.commands.items():
+                index[(*path, name)] = (cmd, module)
+            for name, sub in module.modules.items():
+                stack.append(((*path, name), sub))
+        return index
+
+    def _walk_command(self, first_arg: str, args: Args) -> CommandCacheEntry:
+        """
+        Resolve a command by walking the module tree.
+
+        Args:
+            first_arg (): Normalized first token
+            args (): Remaining tokens
+
+        Returns:
+            Ready-made cached arguments
+        """
         module: BaseModule | UserAny = self
         while [first_arg] + args:
             modules, commands = module.modules, module.commands
@@ -793,6 +904,8 @@ class SpaceWorld:
             - May execute pending command
             - Writes to output via writer
         """
+        # Сбрасываем состояние до выполнения: одно поле кодирует один бит
+        self.confirmation_command = None
         if response[0].lower() in {"yes", "y"}:
             self.writer.info(f"Executing the command: {response}")
             self.execute_command(response, confirmation=True)
@@ -827,7 +940,7 @@ class SpaceWorld:
             - System remains in confirmation state until user responds
             - Command won't execute until confirmed
         """
-        self.writer.input(func.config["confirm"])
+        self.writer.input(func.confirm)
         self.confirmation_command = command
 
     @annotation_depends  # noqa
@@ -901,6 +1014,6 @@ def run(func: DynamicCommand | None = None, args: Args | None = None) -> None:
     if args is None:
         args = sys.argv[1:]
     cns.execute(args)
-    while cns.confirmation_command:
+    while cns.confirmation_command is not None:
         user_input = input(">>> ")
         cns.execute(shlex.split(user_input))
@@ -45,9 +45,11 @@ def register(
     """
     if hasattr(target, "__bases__") and hasattr(target, "__mro__"):
         module_func(module)
-        for name in dir(target):
-            if name.startswith("_"):
-                module.decorator(getattr(target, name))
+        # vars() читает __dict__ класса напрямую — без обхода MRO, как dir()
+        for name, attr in vars(target).items():
+            if name.startswith("_") or not callable(attr):
+                continue
+            module.decorator(getattr(target, name))
         return target
     return command_func(target)
 
@@ -63,6 +65,9 @@ def annotation_depends(func: Callable[..., UserAny]) -> Callable[..., UserAny]:
     Returns:
         A wrapper function with embedded dependencies
     """
+    # signature() дорогая (строит Signature, разворачивает __wrapped__) —
+    # считаем один раз при декорировании, а не на каждый вызов
+    parameters = tuple(signature(func).parameters.values())
 
     @wraps(func)
     def wrapper(*args: UserAny, **kwargs: UserAny) -> UserAny:
@@ -76,7 +81,6 @@ def annotation_depends(func: Callable[..., UserAny]) -> Callable[..., UserAny]:
         Returns:
             UserAny
         """
-        parameters = tuple(signature(func).parameters.values())
         annotations = AnnotationManager()
         processed_args, processed_kwargs, _ = annotations.preparing_args(
             parameters, list(args), kwargs
@@ -94,7 +98,7 @@ class BaseCommandConfig(TypedDict):
     deprecated: bool | str  # noqa
     confirm: bool | str  # noqa
     history: bool  # noqa
-    activate_modes: set[str]  # noqa
+    activate_modes: frozenset[str]  # noqa
     example: str  # noqa
     big_docs: str  # noqa
     docs: str  # noqa
@@ -110,5 +114,5 @@ class BaseCommandAnnotated(TypedDict, total=False):
     confirm: bool | str  # noqa
     examples: str | list[str]  # noqa
     history: bool  # noqa
-    activate_modes: set[str]  # noqa
+    activate_modes: set[str] | str  # noqa
     docs: str  # noqa
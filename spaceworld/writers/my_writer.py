@@ -1,4 +1,6 @@
-"""The implementation of the MyWriter class is inherited from Writer. Uses print."""
+"""The implementation of the MyWriter class is inherited from Writer. Uses stdout."""
+
+import sys
 
 from .._types import UserAny
 
@@ -12,12 +14,16 @@ class MyWriter(Writer):
     This concrete writer implements the Writer interface by:
     - Adding message type prefixes (INFO/WARNING/ERROR/INPUT)
     - Joining multiple text arguments with spaces
-    - Outputting to standard print()
+    - Outputting straight through sys.stdout.write
 
     Suitable for basic console applications where simple formatted output is needed.
     """
 
-    __slots__ = ()
+    __slots__ = ("_out",)
+
+    def __init__(self) -> None:
+        """Bind the stdout write method once instead of resolving it per call."""
+        self._out = sys.stdout.write
 
     def write(self, *text: UserAny, prefix: str = "") -> None:
         """
@@ -27,7 +33,7 @@ class MyWriter(Writer):
             prefix ():
             *text: Items to display (will be space-joined and string-converted)
         """
-        print(f"{prefix}{' '.join(str(item) for item in text)}")
+        self._out(f"{prefix}{' '.join(map(str, text))}\n")
 
     def info(self, *text: UserAny) -> None:
         """